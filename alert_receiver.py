@@ -0,0 +1,38 @@
+"""Local stand-in for the stock alert webhook; prints every delivery it receives.
+
+    python alert_receiver.py [--port 8765]
+    ALERT_WEBHOOK_URL=http://localhost:8765/
+"""
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+
+class AlertHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        for alert in payload.get('alerts', []):
+            print(json.dumps(alert, ensure_ascii=False), flush=True)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    server = HTTPServer(('localhost', args.port), AlertHandler)
+    print(f'Listening for stock alerts on http://localhost:{args.port}/', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Measure cold start: import time of ``app``, ``create_app()`` and the first requests.
+
+Every sample runs in a fresh interpreter so module caches do not hide the cost.
+``first_db_request`` is the first request that queries the database, so it
+includes opening the pool and configuring the mappers.
+
+    python bench_startup.py [--runs 10] [--migrations]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SETUP = """
+import app as app_module
+flask_app = app_module.create_app(test_config={'SQLALCHEMY_DATABASE_URI': %(database_uri)r}, migrations=False)
+with flask_app.app_context():
+    app_module.db.create_all()
+"""
+
+SAMPLE = """
+import json, sys, time
+t0 = time.perf_counter()
+import app as app_module
+t1 = time.perf_counter()
+flask_app = app_module.create_app(
+    test_config={'SQLALCHEMY_DATABASE_URI': %(database_uri)r, 'SECRET_KEY': 'bench'},
+    migrations=%(migrations)r,
+)
+t2 = time.perf_counter()
+client = flask_app.test_client()
+response = client.get('/')
+t3 = time.perf_counter()
+assert response.status_code == 200, response.status_code
+response = client.get('/alerts')
+t4 = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({
+    'import': t1 - t0,
+    'create_app': t2 - t1,
+    'first_request': t3 - t2,
+    'first_db_request': t4 - t3,
+    'total': t4 - t0,
+    'modules': len(sys.modules),
+}))
+"""
+
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_python(code):
+    # Run from the repository so "import app" works wherever the benchmark is started.
+    return subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True,
+                          cwd=REPO_DIR).stdout
+
+
+def run_sample(database_uri, migrations):
+    output = run_python(SAMPLE % {'database_uri': database_uri, 'migrations': migrations})
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--migrations', action='store_true',
+                        help='also initialize Flask-Migrate, as "flask db" commands do')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # A file database keeps the schema between samples without sharing a connection.
+        database_uri = 'sqlite:///' + os.path.join(directory, 'bench.db')
+        run_python(SETUP % {'database_uri': database_uri})
+        samples = [run_sample(database_uri, args.migrations) for _ in range(args.runs)]
+
+    for key in ('import', 'create_app', 'first_request', 'first_db_request', 'total'):
+        values = [sample[key] * 1000 for sample in samples]
+        print(f'{key:<16} median {statistics.median(values):8.2f} ms   min {min(values):8.2f} ms')
+    print(f'{"modules":<16} {samples[-1]["modules"]}')
+
+
+if __name__ == '__main__':
+    main()
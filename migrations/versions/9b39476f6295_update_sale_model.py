@@ -17,6 +17,8 @@ depends_on = None
 
 
 def upgrade():
+    # sale_order.id defaults to this sequence, which used to be created by hand
+    op.execute('CREATE SEQUENCE IF NOT EXISTS sales_order_seq')
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('sale_order',
     sa.Column('id', sa.Integer(), server_default=sa.text("nextval('sales_order_seq')"), nullable=False),
@@ -36,3 +38,4 @@ def downgrade():
     op.drop_column('sale', 'sale_order_id')
     op.drop_table('sale_order')
     # ### end Alembic commands ###
+    op.execute('DROP SEQUENCE IF EXISTS sales_order_seq')
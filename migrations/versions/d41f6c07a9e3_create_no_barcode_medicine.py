@@ -0,0 +1,53 @@
+"""create no barcode medicine
+
+Revision ID: d41f6c07a9e3
+Revises: b5d83a61f0c2
+Create Date: 2026-10-19 16:40:12.907314
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41f6c07a9e3'
+down_revision = 'b5d83a61f0c2'
+branch_labels = None
+depends_on = None
+
+NO_BARCODE_MEDICINE_NAME = 'Medicine without barcode'
+# Sales of unknown barcodes used to be booked against this hard-coded id
+LEGACY_NO_BARCODE_MEDICINE_ID = 18
+
+
+def upgrade():
+    connection = op.get_bind()
+    params = {'name': NO_BARCODE_MEDICINE_NAME, 'legacy_id': LEGACY_NO_BARCODE_MEDICINE_ID}
+
+    existing = connection.execute(sa.text(
+        'SELECT medicine_id FROM medicine_detail WHERE medicine_name = :name OR medicine_name_bg = :name'
+    ), params).first()
+    if existing:
+        return
+
+    # Existing databases keep their row 18 as the fallback; only the lookup
+    # name is set, medicine_name_bg (shown on the tills) stays as it was.
+    medicine_id = connection.execute(sa.text(
+        'UPDATE medicine_detail SET medicine_name = :name WHERE medicine_id = :legacy_id RETURNING medicine_id'
+    ), params).scalar()
+    if medicine_id is None:
+        medicine_id = connection.execute(sa.text(
+            'INSERT INTO medicine_detail (medicine_name, medicine_name_bg) VALUES (:name, :name) RETURNING medicine_id'
+        ), params).scalar()
+
+    version = connection.execute(sa.text(
+        'UPDATE catalog_version SET version = version + 1 WHERE id = 1 RETURNING version'
+    )).scalar()
+    connection.execute(sa.text(
+        'INSERT INTO catalog_change (version, medicine_id) VALUES (:version, :medicine_id)'
+    ), {'version': version, 'medicine_id': medicine_id})
+
+
+def downgrade():
+    # The fallback medicine may already have sales booked against it, so it is kept.
+    pass
@@ -0,0 +1,228 @@
+"""Bulk-load a deterministic synthetic catalog and sales history with COPY.
+
+Runs against a database upgraded with ``flask db upgrade``; the same ``--seed``
+always produces the same rows.
+
+    python seed.py --medicines 50000 --sales 1000000 --truncate
+"""
+import argparse
+import io
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from app import NO_BARCODE_MEDICINE_NAME, create_app, db
+
+NO_BARCODE_MEDICINE_ID = 1
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+START = datetime(2024, 1, 1, 8, 0, 0)
+CHUNK_ROWS = 200000
+
+TABLES = ['sale', 'sale_order', 'purchase', 'inventory', 'medicine_barcode', 'catalog_change', 'stock_alert',
+          'medicine_detail']
+# sale_order.id is filled from a standalone sequence, see migration 9b39476f6295
+SEQUENCES = {
+    'medicine_detail': ('medicine_id', None),
+    'medicine_barcode': ('barcode_id', None),
+    'inventory': ('inventory_id', None),
+    'purchase': ('purchase_id', None),
+    'sale_order': ('id', 'sales_order_seq'),
+    'sale': ('sale_id', None),
+}
+
+GROUPS = ['Analgesics', 'Antibiotics', 'Antihistamines', 'Cardiovascular', 'Dermatology', 'Vitamins']
+MANUFACTURERS = ['Sopharma', 'Actavis', 'Tchaikapharma', 'Bayer', 'Sandoz', 'Pfizer', 'Teva', 'Zentiva']
+MEASURES = ['box', 'bottle', 'tube', 'blister']
+SYLLABLES = ['al', 'be', 'cor', 'dex', 'fen', 'lin', 'mox', 'pra', 'ril', 'sta', 'tin', 'vir', 'xo', 'zol']
+
+
+def check_schema(connection):
+    from alembic.script import ScriptDirectory
+
+    head = ScriptDirectory(MIGRATIONS_DIR).get_current_head()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('alembic_version')")
+        if cursor.fetchone()[0] is None:
+            raise SystemExit('Database has no alembic_version table; run "flask db upgrade" first.')
+        cursor.execute('SELECT version_num FROM alembic_version')
+        current = cursor.fetchone()
+    if not current or current[0] != head:
+        raise SystemExit(f'Database is at revision {current and current[0]}, expected {head}; '
+                         f'run "flask db upgrade" first.')
+
+
+def check_empty(connection, truncate):
+    with connection.cursor() as cursor:
+        if truncate:
+            cursor.execute(f'TRUNCATE {", ".join(TABLES)} RESTART IDENTITY CASCADE')
+            return
+        # The migrations create the no-barcode fallback medicine and its
+        # catalog_change row; those are replaced by the seeded fallback.
+        checks = [(table, f'SELECT EXISTS (SELECT 1 FROM {table})')
+                  for table in TABLES if table not in ('medicine_detail', 'catalog_change')]
+        checks.append(('medicine_detail', 'SELECT EXISTS (SELECT 1 FROM medicine_detail '
+                                          'WHERE medicine_name IS DISTINCT FROM %(name)s)'))
+        for table, query in checks:
+            cursor.execute(query, {'name': NO_BARCODE_MEDICINE_NAME})
+            if cursor.fetchone()[0]:
+                raise SystemExit(f'Table {table} is not empty; pass --truncate to replace its contents.')
+        cursor.execute('DELETE FROM catalog_change')
+        cursor.execute('DELETE FROM medicine_detail')
+
+
+def copy_rows(connection, table, columns, rows):
+    # Rows are tab separated with \N for NULL, streamed in bounded chunks.
+    started = time.perf_counter()
+    statement = f'COPY {table} ({", ".join(columns)}) FROM STDIN'
+    count = 0
+    with connection.cursor() as cursor:
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(row)
+            count += 1
+            if count % CHUNK_ROWS == 0:
+                buffer.seek(0)
+                cursor.copy_expert(statement, buffer)
+                buffer = io.StringIO()
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+    elapsed = time.perf_counter() - started
+    print(f'{table:<18} {count:>10} rows  {elapsed:7.2f} s')
+    return count
+
+
+def reset_sequences(connection):
+    with connection.cursor() as cursor:
+        for table, (column, sequence) in SEQUENCES.items():
+            sequence_sql = f"'{sequence}'" if sequence else f"pg_get_serial_sequence('{table}', '{column}')"
+            cursor.execute(f'SELECT setval({sequence_sql}, COALESCE(MAX({column}), 0) + 1, false) FROM {table}')
+        cursor.execute('INSERT INTO catalog_version (id, version) SELECT 1, COALESCE(MAX(version), 0) FROM catalog_change '
+                       'ON CONFLICT (id) DO UPDATE SET version = EXCLUDED.version')
+
+
+def medicine_ids(medicines):
+    # Generated medicines follow the no-barcode fallback, which is always id 1.
+    return list(range(NO_BARCODE_MEDICINE_ID + 1, medicines + NO_BARCODE_MEDICINE_ID + 1))
+
+
+def medicine_rows(rng, ids):
+    yield f'{NO_BARCODE_MEDICINE_ID}\t{NO_BARCODE_MEDICINE_NAME}\t\\N\t\\N\t\\N\t{NO_BARCODE_MEDICINE_NAME}\t\\N\t\\N\t\\N\t\\N\n'
+    for medicine_id in ids:
+        name = ''.join(rng.choice(SYLLABLES) for _ in range(3)).capitalize() + f' {medicine_id}'
+        strength = rng.choice((5, 10, 20, 50, 100, 250, 500))
+        opiate = 'yes' if rng.random() < 0.02 else '\\N'
+        threshold = rng.randint(5, 50) if rng.random() < 0.5 else '\\N'
+        yield (f'{medicine_id}\t{name} {strength}mg\t{rng.choice(GROUPS)}\t{rng.choice(MANUFACTURERS)}\t'
+               f'{rng.choice(MEASURES)}\t{name} {strength} mg\tN{rng.randint(1, 7)}{rng.randint(10, 99)}\t'
+               f'{opiate}\t{rng.randint(100000, 999999)}\t{threshold}\n')
+
+
+def barcode_rows(rng, ids):
+    for barcode_id, medicine_id in enumerate(ids, start=1):
+        barcode_2 = f'381{medicine_id:010d}' if rng.random() < 0.1 else '\\N'
+        yield f'{barcode_id}\t{medicine_id}\t380{medicine_id:010d}\t{barcode_2}\n'
+
+
+def catalog_change_rows(ids):
+    for version, medicine_id in enumerate([NO_BARCODE_MEDICINE_ID] + ids, start=1):
+        yield f'{version}\t{medicine_id}\n'
+
+
+def inventory_rows(rng, ids, prices, today):
+    for inventory_id, medicine_id in enumerate(ids, start=1):
+        expiry_date = today + timedelta(days=rng.randint(-30, 900))
+        yield (f'{inventory_id}\t{medicine_id}\t{prices[medicine_id]}\t{rng.randint(0, 500)}\t'
+               f'{expiry_date.isoformat()}\tf\n')
+
+
+def purchase_rows(rng, ids, prices, purchases, today):
+    for purchase_id in range(1, purchases + 1):
+        medicine_id = rng.choice(ids)
+        timestamp = START + timedelta(minutes=purchase_id * 7)
+        expiry_date = today + timedelta(days=rng.randint(-30, 900))
+        yield (f'{purchase_id}\t{medicine_id}\t{rng.randint(1, 200)}\t{prices[medicine_id]}\t{timestamp}\t'
+               f'{expiry_date.isoformat()}\tB{rng.randint(100000, 999999)}\tf\tf\tf\t'
+               f'S{rng.randint(1, 40):03d}\t\\N\n')
+
+
+def sale_order_rows(orders):
+    for order_id in range(1, orders + 1):
+        yield f'{order_id}\t{START + timedelta(seconds=order_id * 30)}\n'
+
+
+def sale_rows(rng, ids, prices, sales, orders):
+    # Weighted towards a small set of fast movers, like a real pharmacy till.
+    fast_movers = ids[:max(1, len(ids) // 20)]
+    for sale_id in range(1, sales + 1):
+        medicine_id = rng.choice(fast_movers) if rng.random() < 0.6 else rng.choice(ids)
+        order_id = (sale_id - 1) * orders // sales + 1
+        timestamp = START + timedelta(seconds=order_id * 30)
+        yield (f'{sale_id}\t{medicine_id}\t{rng.randint(1, 3)}\t{prices[medicine_id]}\t{timestamp}\t'
+               f'\\N\tf\tf\t{order_id}\n')
+
+
+def seed(connection, args):
+    rng = random.Random(args.seed)
+    today = date(2025, 1, 1)
+    ids = medicine_ids(args.medicines)
+    prices = {medicine_id: round(rng.uniform(1, 120), 2) for medicine_id in ids}
+    orders = args.orders if args.orders is not None else max(1, args.sales // 3)
+
+    copy_rows(connection, 'medicine_detail',
+              ['medicine_id', 'medicine_name_bg', '"group"', 'manufacturer', 'sales_measure', 'medicine_name',
+               'atc_code', 'opiate', 'nhif_code', 'reorder_threshold'],
+              medicine_rows(rng, ids))
+    copy_rows(connection, 'medicine_barcode', ['barcode_id', 'medicine_id', 'barcode_1', 'barcode_2'],
+              barcode_rows(rng, ids))
+    copy_rows(connection, 'catalog_change', ['version', 'medicine_id'], catalog_change_rows(ids))
+    copy_rows(connection, 'inventory',
+              ['inventory_id', 'medicine_id', 'price', 'quantity', 'expiry_date', 'expiry_alerted'],
+              inventory_rows(rng, ids, prices, today))
+    copy_rows(connection, 'purchase',
+              ['purchase_id', 'medicine_id', 'quantity', 'price', 'timestamp', 'expiry_date', 'batch_number',
+               'verified', 'reported', 'sespa_reporting', 'supplier_code', 'purchase_order'],
+              purchase_rows(rng, ids, prices, args.purchases, today))
+    copy_rows(connection, 'sale_order', ['id', 'timestamp'], sale_order_rows(orders))
+    copy_rows(connection, 'sale',
+              ['sale_id', 'medicine_id', 'quantity', 'price', 'timestamp', 'batch_number', 'verified', 'reported',
+               'sale_order_id'],
+              sale_rows(rng, ids, prices, args.sales, orders))
+    reset_sequences(connection)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--medicines', type=int, default=50000)
+    parser.add_argument('--purchases', type=int, default=200000)
+    parser.add_argument('--sales', type=int, default=1000000)
+    parser.add_argument('--orders', type=int, help='number of sale orders (default: sales / 3)')
+    parser.add_argument('--truncate', action='store_true', help='empty the seeded tables first')
+    args = parser.parse_args()
+
+    if args.medicines < 1:
+        parser.error('--medicines must be at least 1')
+
+    app = create_app(migrations=False)
+    with app.app_context():
+        connection = db.engine.raw_connection()
+        try:
+            check_schema(connection)
+            check_empty(connection, args.truncate)
+            started = time.perf_counter()
+            seed(connection, args)
+            connection.commit()
+            print(f'{"total":<18} {"":>10}       {time.perf_counter() - started:7.2f} s')
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        with db.engine.begin() as analyze_connection:
+            analyze_connection.exec_driver_sql('ANALYZE')
+
+
+if __name__ == '__main__':
+    main()